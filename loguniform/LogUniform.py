@@ -1,5 +1,36 @@
+import importlib.util
+import math
+import sys
+
 import numpy as np
-from abc import ABC, abstractmethod
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+
+def _lazy_import(name):
+    # the module is only executed on first attribute access
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition('.')
+    setattr(sys.modules[parent], child, module)
+    loader.exec_module(module)
+    return module
+
+
+# importing numba takes longer than importing numpy, so the compiled kernels
+# (and numba) are only imported when first used
+_kernels = _lazy_import(__package__ + '._kernels')
+
+# numexpr is only used to evaluate ppf for arrays when numba is not installed
+# (the numba kernels are faster for large arrays), and only from this size
+# on, since below it its overhead is larger than the gains
+_NUMEXPR_MIN_SIZE = 1024
 
 # the "Jeffreys" or log-uniform prior is already implemented in scipy
 # as the 'reciprocal' distribution (and, in newer versions, as 'loguniform').
@@ -11,52 +42,64 @@ def _array_or_float(x):
     return x
 
 
-class dist(ABC):
+def _check_batch_bounds(a, b):
+    # bounds of the batch methods, which must satisfy 0 < a < b
+    a, b = np.asarray(a), np.asarray(b)
+    if not (np.all(a > 0) and np.all(b > a)):
+        raise ValueError('need 0 < a < b for all distributions')
+    return a, b
+
+
+def _apply_kernel(kernel, x, dtype, *args):
+    # evaluate a compiled array kernel over x, keeping its shape
+    x = np.asarray(x, dtype=dtype, order='C')
+    out = np.empty(x.shape, dtype=dtype)
+    kernel(x.reshape(-1), *args, out.reshape(-1))
+    return _array_or_float(out)
+
+
+class dist:
     """
-    A simple distribution class. Requires the implementation of properties `a`
-    and `b`, representing the bounds of the distribution, and methods `pdf`,
-    `cdf` for the probability and cumulative density functions and `ppf` for
-    the inverse of `cdf`.
+    A simple distribution class. Subclasses must set the attributes `a` and
+    `b`, representing the bounds of the distribution, and implement methods
+    `pdf(x, dtype)`, `cdf(x, dtype)` for the probability and cumulative
+    density functions and `ppf(p, dtype)` for the inverse of `cdf`.
+
+    For array arguments, the `dtype` of pdf, cdf and ppf (np.float64 or
+    np.float32) sets the floating point type of the calculations and of the
+    result. Single precision is about twice as fast for large arrays.
     """
 
-    @property
-    @abstractmethod
-    def a(self):
-        pass
-
-    @property
-    @abstractmethod
-    def b(self):
-        pass
+    __slots__ = ()
 
     def _support_mask(self, x):
         # where x is inside the support
         return np.asarray((self.a <= x) & (x <= self.b))
 
-    def _separate_support_mask(self, x):
-        # where x is inside the support, separate for lower and upper bounds
-        return np.asarray(self.a <= x), np.asarray(x <= self.b)
-
-    @abstractmethod
-    def pdf(self, x):
-        """ Probability density function evaluated at x. """
-        pass
-
-    @abstractmethod
-    def cdf(self, x):
-        """ Cumulative density function evaluated at x. """
-        pass
-
-    @abstractmethod
-    def ppf(self, p):
-        """ Percent point function (inverse of `cdf`) evaluated at p. """
-        pass
+    def _constants(self, dtype):
+        # the constants of `_double_constants`, in the precision given by
+        # dtype. The single precision ones are only built when first needed
+        if dtype is np.float64:
+            return self._double_constants()
+        dtype = np.dtype(dtype)
+        if dtype == np.float64:
+            return self._double_constants()
+        if dtype == np.float32:
+            if self._consts32 is None:
+                self._consts32 = tuple(map(np.float32,
+                                           self._double_constants()))
+            return self._consts32
+        raise ValueError('dtype must be np.float64 or np.float32')
 
     def sf(self, x):
         """ Survival function (1 - `cdf`) evaluated at x. """
         return 1 - self.cdf(x)
 
-    def rvs(self, size=1):
+    def _rvs(self, size, rng, dtype):
+        # inverse transform sampling, subclasses can do better
+        return self.ppf(rng.random(size, dtype=dtype), dtype=dtype)
+
+    def rvs(self, size=1, random_state=None, dtype=np.float64):
         """
         Random samples from the distribution.
 
@@ -64,13 +107,25 @@ class dist(ABC):
         ----------
         size : int or tuple of ints, optional
             Number of random samples to draw (default is 1).
+        random_state : None, int or `numpy.random.Generator`, optional
+            Seed or generator used to draw the samples. By default, use a
+            generator owned by the distribution.
+        dtype : np.float64 or np.float32, optional
+            Floating point type of the samples. Single precision is
+            recommended when drawing many samples.
 
         Returns
         -------
         rvs : ndarray or scalar
         """
-        u = np.random.uniform(size=size)
-        s = self.ppf(u)
+        if random_state is not None:
+            rng = np.random.default_rng(random_state)
+        else:
+            # creating the generator is slow, so only do it when needed
+            if self._rng is None:
+                self._rng = np.random.default_rng()
+            rng = self._rng
+        s = self._rvs(size, rng, dtype)
         return s.item() if size == 1 else s
 
     def support(self):
@@ -118,8 +173,10 @@ class LogUniform(dist):
     pdf     : probability density function
     logpdf  : logarithm of the probability density function
     cdf     : cumulative density function
+    cdf_sorted : cumulative density function, for sorted arrays
     ppf     : percent point function (inverse of cdf)
     support : support of the distribution
+    pdf_batch, cdf_batch, ppf_batch : evaluate many distributions at once
 
     Properties
     ----------
@@ -127,52 +184,186 @@ class LogUniform(dist):
 
     """
 
-    # defaults for lower and upper bounds of the distribution
-    a = None
-    b = None
+    # all the state of the distribution, computed in __init__
+    __slots__ = ('a', 'b', 'q', '_log_a', '_inv_q', '_log_q', '_consts32',
+                 '_rng')
 
     def __init__(self, a, b):
-        assert a > 0 and b > 0, \
-            'parameters `a` and `b` must both be positive'
-        assert b > a, \
-            'upper limit `b` cannot be less than or equal to lower limit `a`'
+        if not (a > 0 and b > a):
+            raise ValueError(f'need 0 < a < b, got a={a}, b={b}')
 
         self.a, self.b = a, b
-        self.q = np.log(self.b) - np.log(self.a)
-
-    def pdf(self, x):
-        x = np.asarray(x)
-        m = self._support_mask(x)
-        p = np.zeros_like(x, dtype=np.float64)
-        p[m] = 1 / (x[m] * self.q)
+        # constants used by pdf, cdf and ppf
+        self._log_a = log_a = math.log(a)
+        self.q = q = math.log(b) - log_a
+        self._inv_q = 1.0 / q
+        self._log_q = math.log(q)
+        self._consts32 = None
+
+        self._rng = None
+
+    def _double_constants(self):
+        # constants used for array arguments
+        return (float(self.a), float(self.b), self.q, self._inv_q,
+                self._log_a)
+
+    def pdf(self, x, dtype=np.float64):
+        # the scalar fast paths only return double precision, other values of
+        # dtype go through `_constants`, which checks them
+        if dtype is np.float64:
+            if type(x) is float or type(x) is int:
+                return self._inv_q / x if self.a <= x <= self.b else 0.0
+            if _kernels.HAS_NUMBA and np.isscalar(x):
+                return _kernels._lu_pdf_scalar(float(x), self.a, self.b,
+                                               self._inv_q)
+        a, b, _, inv_q, _ = self._constants(dtype)
+        if _kernels.HAS_NUMBA:
+            return _apply_kernel(_kernels._lu_pdf, x, dtype, a, b, inv_q)
+        x = np.asarray(x, dtype=dtype)
+        inside = (a <= x) & (x <= b)
+        # divide by 1 outside the support, so x = 0 causes no warnings
+        p = inside * (inv_q / np.where(inside, x, 1))
         return _array_or_float(p)
 
     def logpdf(self, x):
-        x = np.asarray(x)
+        if type(x) is float or type(x) is int:
+            if self.a <= x <= self.b:
+                return -math.log(x) - self._log_q
+            return -math.inf
+        if _kernels.HAS_NUMBA:
+            if np.isscalar(x):
+                return _kernels._lu_logpdf_scalar(float(x), self.a, self.b,
+                                                  self._log_q)
+            return _apply_kernel(_kernels._lu_logpdf, x, np.float64,
+                                 self.a, self.b, self._log_q)
+        x = np.asarray(x, dtype=np.float64)
         m = self._support_mask(x)
-        logp = np.full_like(x, -np.inf, dtype=np.float64)
-        logp[m] = -np.log(x[m]) - np.log(self.q)
+        logp = np.full_like(x, -np.inf)
+        logp[m] = -np.log(x[m]) - self._log_q
         return _array_or_float(logp)
 
-    def cdf(self, x):
-        x = np.asarray(x)
-        _, m2 = self._separate_support_mask(x)
-        # cdf = 0.0
-        c = np.zeros_like(x, dtype=np.float64)
-        # for values above upper limit, cdf = 1.0
-        c[~m2] = 1.0
-        # otherwise, calculate
-        m = self._support_mask(x)
-        c[m] = np.log(x[m] / self.a) / self.q
+    def cdf(self, x, dtype=np.float64):
+        if dtype is np.float64:
+            if type(x) is float or type(x) is int:
+                if x < self.a:
+                    return 0.0
+                if x > self.b:
+                    return 1.0
+                return math.log(x / self.a) * self._inv_q
+            if _kernels.HAS_NUMBA and np.isscalar(x):
+                return _kernels._lu_cdf_scalar(float(x), self.a, self.b,
+                                               self._inv_q)
+        a, b, _, inv_q, _ = self._constants(dtype)
+        if _kernels.HAS_NUMBA:
+            return _apply_kernel(_kernels._lu_cdf, x, dtype, a, b, inv_q)
+        x = np.asarray(x, dtype=dtype)
+        # clipping to the support gives cdf = 0.0 below `a` and 1.0 above `b`
+        c = np.log(np.clip(x, a, b) / a) * inv_q
         return _array_or_float(c)
 
-    def ppf(self, p):
-        p = np.asarray(p)
+    def cdf_sorted(self, x, dtype=np.float64):
+        """
+        Cumulative density function evaluated at x, which must be a 1d array
+        sorted in ascending order, with any nans at the end (as `np.sort` puts
+        them). Only the points inside the support are evaluated, which is
+        faster than `cdf` when many points are outside.
+        """
+        a, b, _, inv_q, _ = self._constants(dtype)
+        x = np.asarray(x, dtype=dtype)
+        xs = x.reshape(-1)
+        i0 = np.searchsorted(xs, a)
+        i1 = np.searchsorted(xs, b, side='right')
+        # nans are sorted after inf
+        i2 = np.searchsorted(xs, np.inf, side='right')
+        c = np.empty_like(xs)
+        c[:i0] = 0.0
+        c[i0:i1] = np.log(xs[i0:i1] / a) * inv_q
+        c[i1:i2] = 1.0
+        c[i2:] = np.nan
+        return _array_or_float(c.reshape(x.shape))
+
+    def ppf(self, p, dtype=np.float64):
+        if dtype is np.float64:
+            if type(p) is float or type(p) is int:
+                if 0 <= p <= 1:
+                    return math.exp(self._log_a + p * self.q)
+                return math.nan
+            if _kernels.HAS_NUMBA and np.isscalar(p):
+                return _kernels._lu_ppf_scalar(float(p), self._log_a, self.q)
+        # for arrays, use numba if installed, then numexpr, then NumPy, all
+        # evaluating exp(log(a) + p q)
+        _, _, q, _, log_a = self._constants(dtype)
+        if _kernels.HAS_NUMBA:
+            return _apply_kernel(_kernels._lu_ppf, p, dtype, log_a, q)
+        p = np.asarray(p, dtype=dtype)
+        if numexpr is not None and p.size >= _NUMEXPR_MIN_SIZE:
+            v = numexpr.evaluate(
+                'where((p >= 0) & (p <= 1), exp(log_a + p * q), nan)',
+                local_dict=dict(p=p, log_a=log_a, q=q,
+                                nan=np.dtype(dtype).type(np.nan)))
+            return _array_or_float(v)
         # ppf = nan
-        v = np.full_like(p, np.nan, dtype=np.float64)
+        v = np.full_like(p, np.nan)
         # for probabilities >=0 and <=1, calculate
         m = (p >= 0.0) & (p <= 1.0)
-        v[m] = np.exp(np.log(self.a) + p[m] * (self.q))
+        v[m] = np.exp(log_a + p[m] * q)
+        return _array_or_float(v)
+
+    def _rvs(self, size, rng, dtype):
+        # log(x) is uniform between log(a) and log(b)
+        _, _, q, _, log_a = self._constants(dtype)
+        return np.exp(log_a + q * rng.random(size, dtype=dtype))
+
+    @staticmethod
+    def pdf_scalar_addr():
+        """
+        Address of a compiled C function evaluating the pdf at a single point,
+        with signature ``double lu_pdf(double x, double a, double b)``, the
+        same as `lu_pdf_scalar`. It can be wrapped with ctypes and called from
+        numba-compiled code. Requires numba.
+        """
+        return _kernels._lu_pdf_cfunc().address
+
+    # the following evaluate many distributions at once, without creating
+    # LogUniform instances. The arguments are broadcast against each other
+    # following the usual NumPy rules: scalar bounds apply to all points, and
+    # bounds of shape (N, 1) with points of shape (M,) give results of shape
+    # (N, M), one row per distribution. Bounds must satisfy 0 < a < b.
+
+    @staticmethod
+    def pdf_batch(a, b, x):
+        """
+        Probability density function of log-uniform distributions with
+        bounds `a` and `b`, evaluated at x.
+        """
+        a, b = _check_batch_bounds(a, b)
+        x = np.asarray(x)
+        q = np.log(b / a)
+        m = (a <= x) & (x <= b)
+        p = np.divide(1.0, x * q, out=np.zeros(m.shape), where=m)
+        return _array_or_float(p)
+
+    @staticmethod
+    def cdf_batch(a, b, x):
+        """
+        Cumulative density function of log-uniform distributions with bounds
+        `a` and `b`, evaluated at x.
+        """
+        a, b = _check_batch_bounds(a, b)
+        x = np.asarray(x)
+        c = np.log(np.clip(x, a, b) / a) / np.log(b / a)
+        return _array_or_float(c)
+
+    @staticmethod
+    def ppf_batch(a, b, p):
+        """
+        Percent point function (inverse of `cdf`) of log-uniform distributions
+        with bounds `a` and `b`, evaluated at p.
+        """
+        a, b = _check_batch_bounds(a, b)
+        p = np.asarray(p)
+        m = (p >= 0.0) & (p <= 1.0)
+        v = np.where(m, np.exp(np.log(a) + p * np.log(b / a)), np.nan)
         return _array_or_float(v)
 
     @property
@@ -211,6 +402,122 @@ class LogUniform(dist):
         return f1 / f2 - 3
 
 
+class LogUniformArray:
+    """
+    A collection of independent log-uniform distributions, with the bounds of
+    all distributions stored in arrays. This is much faster than a list of
+    `LogUniform` instances when evaluating many priors at once.
+
+    Parameters
+    ----------
+    a, b : array_like
+           Lower and upper bounds of each distribution.
+
+    Methods
+    -------
+    pdf     : probability density function
+    logpdf  : logarithm of the probability density function
+    cdf     : cumulative density function
+    ppf     : percent point function (inverse of cdf)
+    rvs     : random samples
+    support : support of the distributions
+
+    Methods evaluate every distribution at every point, so for bounds of shape
+    (N,) and `x` of shape (M,) the result has shape (N, M).
+
+    Properties
+    ----------
+    mean
+
+    """
+
+    def __init__(self, a, b):
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64),
+                                   np.asarray(b, dtype=np.float64))
+        if not (np.all(a > 0) and np.all(b > a)):
+            raise ValueError('need 0 < a < b for all distributions')
+
+        self.a, self.b = a.copy(), b.copy()
+        self.q = np.log(self.b) - np.log(self.a)
+        # constants used by pdf, cdf and ppf
+        self._log_a = np.log(self.a)
+        self._inv_q = 1.0 / self.q
+        self._log_q = np.log(self.q)
+
+        self._rng = None
+
+    def _expand(self, x):
+        # index adding trailing axes to the bounds, to broadcast against x
+        return (...,) + (None,) * np.ndim(x)
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        e = self._expand(x)
+        m = (self.a[e] <= x) & (x <= self.b[e])
+        p = np.divide(self._inv_q[e], x, out=np.zeros(m.shape), where=m)
+        return _array_or_float(p)
+
+    def logpdf(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        e = self._expand(x)
+        m = (self.a[e] <= x) & (x <= self.b[e])
+        logx = np.log(np.broadcast_to(x, m.shape), out=np.zeros(m.shape),
+                      where=m)
+        logp = np.where(m, -logx - self._log_q[e], -np.inf)
+        return _array_or_float(logp)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        e = self._expand(x)
+        a, b = self.a[e], self.b[e]
+        c = np.log(np.clip(x, a, b) / a) * self._inv_q[e]
+        return _array_or_float(c)
+
+    def ppf(self, p):
+        p = np.asarray(p, dtype=np.float64)
+        e = self._expand(p)
+        m = (p >= 0.0) & (p <= 1.0)
+        v = np.where(m, np.exp(self._log_a[e] + p * self.q[e]), np.nan)
+        return _array_or_float(v)
+
+    def rvs(self, size=None, random_state=None):
+        """
+        Random samples from each of the distributions.
+
+        Parameters
+        ----------
+        size : int or tuple of ints, optional
+            Number of random samples to draw from each distribution. By
+            default, draw one sample per distribution.
+        random_state : None, int or `numpy.random.Generator`, optional
+            Seed or generator used to draw the samples. By default, use a
+            generator owned by the distributions.
+
+        Returns
+        -------
+        rvs : ndarray
+            Samples, with shape `a.shape + size`.
+        """
+        if random_state is not None:
+            rng = np.random.default_rng(random_state)
+        else:
+            # creating the generator is slow, so only do it when needed
+            if self._rng is None:
+                self._rng = np.random.default_rng()
+            rng = self._rng
+        size = () if size is None else tuple(np.atleast_1d(size))
+        e = (...,) + (None,) * len(size)
+        u = rng.random(self.a.shape + size)
+        return np.exp(self._log_a[e] + self.q[e] * u)
+
+    def support(self):
+        return self.a, self.b
+
+    @property
+    def mean(self):
+        return (self.b - self.a) / self.q
+
+
 class ModifiedLogUniform(dist):
     """
     A modified log-uniform distribution, sometimes called a "modified Jeffreys
@@ -228,6 +535,7 @@ class ModifiedLogUniform(dist):
     pdf     : probability density function
     logpdf  : logarithm of the probability density function
     cdf     : cumulative density function
+    cdf_sorted : cumulative density function, for sorted arrays
     ppf     : percent point function (inverse of cdf)
     support : support of the distribution
 
@@ -237,61 +545,119 @@ class ModifiedLogUniform(dist):
 
     """
 
-    # defaults for lower and upper bounds and knee
-    a = 0
-    b = 100
-    knee = 1
+    # all the state of the distribution, computed in __init__, except for the
+    # moments which are only computed when first needed
+    __slots__ = ('a', 'b', 'knee', 'q', '_inv_q', '_log_q', '_consts32',
+                 '_rng', '_moment_values')
 
     def __init__(self, knee, b):
-        assert b > 0, 'upper limit `b` must be positive'
-        assert knee > 0, '`knee` must be positive'
-        assert b > knee, 'upper limit `b` must be larger than `knee`'
+        if not (knee > 0 and b > knee):
+            raise ValueError(f'need 0 < knee < b, got knee={knee}, b={b}')
 
-        self.b = b
+        self.a, self.b = 0, b
         self.knee = knee
 
-        self.q = np.log((self.b + self.knee) / self.knee)
-
-    def pdf(self, x):
-        x = np.asarray(x)
-        m = self._support_mask(x)
-        p = np.zeros_like(x, dtype=np.float64)
-        p[m] = 1 / ((x[m] + self.knee) * self.q)
+        # note that q = log(b/knee + 1), used by cdf and ppf
+        self.q = q = math.log1p(b / knee)
+        self._inv_q = 1.0 / q
+        self._log_q = math.log(q)
+        self._consts32 = None
+
+        self._rng = None
+        self._moment_values = None
+
+    def _double_constants(self):
+        # constants used for array arguments
+        return float(self.knee), float(self.b), self.q, self._inv_q
+
+    def pdf(self, x, dtype=np.float64):
+        if dtype is np.float64:
+            if type(x) is float or type(x) is int:
+                if self.a <= x <= self.b:
+                    return self._inv_q / (x + self.knee)
+                return 0.0
+        knee, b, _, inv_q = self._constants(dtype)
+        x = np.asarray(x, dtype=dtype)
+        inside = (0 <= x) & (x <= b)
+        p = inside * (inv_q / np.where(inside, x + knee, 1))
         return _array_or_float(p)
 
     def logpdf(self, x):
-        x = np.asarray(x)
+        if type(x) is float or type(x) is int:
+            if self.a <= x <= self.b:
+                return -math.log(x + self.knee) - self._log_q
+            return -math.inf
+        x = np.asarray(x, dtype=np.float64)
         m = self._support_mask(x)
-        logp = np.full_like(x, -np.inf, dtype=np.float64)
-        logp[m] = -np.log(x[m] + self.knee) - np.log(self.q)
+        logp = np.full_like(x, -np.inf)
+        logp[m] = -np.log(x[m] + self.knee) - self._log_q
         return _array_or_float(logp)
 
-    def cdf(self, x):
-        x = np.asarray(x)
-        _, m2 = self._separate_support_mask(x)
-        # cdf = 0.0
-        c = np.zeros_like(x, dtype=np.float64)
-        # for values above upper limit, cdf = 1.0
-        c[~m2] = 1.0
-        # otherwise, calculate
-        m = self._support_mask(x)
-        r = self.b / self.knee
-        c[m] = np.log(x[m] / self.knee + 1) / np.log(r + 1)
+    def cdf(self, x, dtype=np.float64):
+        if dtype is np.float64:
+            if type(x) is float or type(x) is int:
+                if x < 0:
+                    return 0.0
+                if x > self.b:
+                    return 1.0
+                return math.log1p(x / self.knee) * self._inv_q
+        knee, b, _, inv_q = self._constants(dtype)
+        x = np.asarray(x, dtype=dtype)
+        # clipping to the support gives cdf = 0.0 below 0 and 1.0 above `b`
+        c = np.log1p(np.clip(x, 0, b) / knee) * inv_q
         return _array_or_float(c)
 
-    def ppf(self, p):
-        p = np.asarray(p)
+    def cdf_sorted(self, x, dtype=np.float64):
+        """
+        Cumulative density function evaluated at x, which must be a 1d array
+        sorted in ascending order, with any nans at the end (as `np.sort` puts
+        them). Only the points inside the support are evaluated, which is
+        faster than `cdf` when many points are outside.
+        """
+        knee, b, _, inv_q = self._constants(dtype)
+        x = np.asarray(x, dtype=dtype)
+        xs = x.reshape(-1)
+        i0 = np.searchsorted(xs, 0)
+        i1 = np.searchsorted(xs, b, side='right')
+        # nans are sorted after inf
+        i2 = np.searchsorted(xs, np.inf, side='right')
+        c = np.empty_like(xs)
+        c[:i0] = 0.0
+        c[i0:i1] = np.log1p(xs[i0:i1] / knee) * inv_q
+        c[i1:i2] = 1.0
+        c[i2:] = np.nan
+        return _array_or_float(c.reshape(x.shape))
+
+    def ppf(self, p, dtype=np.float64):
+        if dtype is np.float64:
+            if type(p) is float or type(p) is int:
+                if 0 <= p <= 1:
+                    return self.knee * math.expm1(self.q * p)
+                return math.nan
+        knee, _, q, _ = self._constants(dtype)
+        p = np.asarray(p, dtype=dtype)
         # ppf = nan
-        v = np.full_like(p, np.nan, dtype=np.float64)
+        v = np.full_like(p, np.nan)
         # for probabilities >=0 and <=1, calculate
         m = (p >= 0.0) & (p <= 1.0)
-        v[m] = self.knee * (-1 + np.exp(np.log(self.b / self.knee + 1) * p[m]))
+        v[m] = knee * np.expm1(q * p[m])
         return _array_or_float(v)
 
+    def _rvs(self, size, rng, dtype):
+        # log(x/knee + 1) is uniform between 0 and q
+        knee, _, q, _ = self._constants(dtype)
+        return knee * np.expm1(q * rng.random(size, dtype=dtype))
+
+    @property
+    def _moments(self):
+        if self._moment_values is None:
+            self._moment_values = _kernels._mlu_moments(
+                float(self.b), float(self.knee), self.q)
+        return self._moment_values
+
     @property
     def mean(self):
-        b, knee, q = self.b, self.knee, self.q
-        return (b + knee * np.log(knee) - knee * np.log(knee + b)) / q
+        return self._moments[0]
 
     @property
     def mode(self):
@@ -299,12 +665,7 @@ class ModifiedLogUniform(dist):
 
     @property
     def var(self):
-        b, knee, q = self.b, self.knee, self.q
-        mu = self.mean
-        return (b**2 - 2*b*knee - 2*knee**2*np.log(knee) 
-                + 2*knee**2*np.log(knee+b) + (4*knee*np.log(knee+b)
-                - 4*knee*np.log(knee)-4*b)*mu 
-                + (2*np.log(knee+b)-2*np.log(knee))*mu**2) / (2*q)
+        return self._moments[1]
 
     @property
     def std(self):
@@ -312,27 +673,8 @@ class ModifiedLogUniform(dist):
 
     @property
     def skewness(self):
-        b, knee, q = self.b, self.knee, self.q
-        mu = self.mean
-        var = self.var
-        return -(-2*b**3 + 3*b**2*knee - 6*b*knee**2 - 6*knee**3*np.log(knee) \
-                 +6*knee**3*np.log(knee+b) + (18*knee**2*np.log(knee+b) \
-                 -18*knee**2*np.log(knee) - 18*b*knee+9*b**2)*mu \
-                 + (18*knee*np.log(knee+b) - 18*knee*np.log(knee) - 18*b)*mu**2 \
-                 + (6*np.log(knee+b) - 6*np.log(knee))*mu**3 \
-                ) / (6*q*var**(3/2))
+        return self._moments[2]
 
     @property
     def kurtosis(self):
-        b, knee, q = self.b, self.knee, self.q
-        mu = self.mean
-        var = self.var
-        return -(-3*b**4 + 4*b**3*knee - 6*b**2*knee**2 + 12*b*knee**3\
-                 +12*knee**4*np.log(knee) - 12*knee**4*np.log(knee+b) \
-                 + (-48*knee**3*np.log(knee+b) + 48*knee**3*np.log(knee) \
-                    + 48*b*knee**2 - 24*b**2*knee + 16*b**3)*mu \
-                 +(-72*knee**2*np.log(knee+b) + 72*knee**2*np.log(knee) \
-                 +72*b*knee-36*b**2)*mu**2 \
-                 + (-48*knee*np.log(knee+b) + 48*knee*np.log(knee) + 48*b)*mu**3 \
-                 + (12*np.log(knee) - 12*np.log(knee+b))*mu**4 + 36*q*var**2\
-                )/(12*q*var**2)
+        return self._moments[3]
@@ -1 +1,15 @@
-from .LogUniform import LogUniform, ModifiedLogUniform
\ No newline at end of file
+import sys
+
+from .LogUniform import LogUniform, LogUniformArray, ModifiedLogUniform
+
+
+def __getattr__(name):
+    # the scalar functions are compiled by numba, which is imported lazily
+    if name in ('lu_pdf_scalar', 'lu_logpdf_scalar'):
+        from . import _kernels
+        return getattr(_kernels, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):  # no module __getattr__ (PEP 562)
+    from ._kernels import lu_pdf_scalar, lu_logpdf_scalar
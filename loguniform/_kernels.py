@@ -0,0 +1,138 @@
+import functools
+import math
+
+# numba is an optional dependency. Without it, the scalar kernels below are
+# plain Python functions and the distribution classes use their NumPy code
+# paths for array inputs.
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+
+# fastmath flags without 'nnan' and 'ninf', since the kernels have to return
+# nan and -inf outside the support
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+# scalar kernels
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _lu_pdf_scalar(x, a, b, inv_q):
+    if a <= x and x <= b:
+        return inv_q / x
+    return 0.0
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _lu_logpdf_scalar(x, a, b, log_q):
+    if a <= x and x <= b:
+        return -math.log(x) - log_q
+    return -math.inf
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _lu_cdf_scalar(x, a, b, inv_q):
+    if x < a:
+        return 0.0
+    if x > b:
+        return 1.0
+    return math.log(x / a) * inv_q
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _lu_ppf_scalar(p, log_a, q):
+    if 0.0 <= p and p <= 1.0:
+        return math.exp(log_a + p * q)
+    return math.nan
+
+
+# array kernels, operating on contiguous 1d arrays `x` and `out`
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _lu_pdf(x, a, b, inv_q, out):
+    for i in prange(x.size):
+        out[i] = _lu_pdf_scalar(x[i], a, b, inv_q)
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _lu_logpdf(x, a, b, log_q, out):
+    for i in prange(x.size):
+        out[i] = _lu_logpdf_scalar(x[i], a, b, log_q)
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _lu_cdf(x, a, b, inv_q, out):
+    for i in prange(x.size):
+        out[i] = _lu_cdf_scalar(x[i], a, b, inv_q)
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def _lu_ppf(p, log_a, q, out):
+    for i in prange(p.size):
+        out[i] = _lu_ppf_scalar(p[i], log_a, q)
+
+
+# moments of the modified log-uniform distribution. The logarithms in the
+# closed forms only appear as log(knee + b) - log(knee) = q, which is used
+# directly to avoid the cancellation when knee << b.
+
+@njit(cache=True)
+def _mlu_moments(b, knee, q):
+    mu = (b - knee * q) / q
+
+    var = (b**2 - 2*b*knee + 2*knee**2*q
+           + (4*knee*q - 4*b)*mu
+           + 2*q*mu**2) / (2*q)
+
+    skewness = -(-2*b**3 + 3*b**2*knee - 6*b*knee**2 + 6*knee**3*q
+                 + (18*knee**2*q - 18*b*knee + 9*b**2)*mu
+                 + (18*knee*q - 18*b)*mu**2
+                 + 6*q*mu**3
+                 ) / (6*q*var**(3/2))
+
+    kurtosis = -(-3*b**4 + 4*b**3*knee - 6*b**2*knee**2 + 12*b*knee**3
+                 - 12*knee**4*q
+                 + (-48*knee**3*q + 48*b*knee**2 - 24*b**2*knee + 16*b**3)*mu
+                 + (-72*knee**2*q + 72*b*knee - 36*b**2)*mu**2
+                 + (-48*knee*q + 48*b)*mu**3
+                 - 12*q*mu**4 + 36*q*var**2
+                 ) / (12*q*var**2)
+
+    return mu, var, skewness, kurtosis
+
+
+# public scalar functions, which can be called from the user's own
+# numba-compiled code (or from Python, if numba is not installed)
+
+@njit(cache=True, fastmath=_FASTMATH)
+def lu_pdf_scalar(x, a, b):
+    """ Probability density function of LogUniform(a, b) evaluated at x. """
+    return _lu_pdf_scalar(x, a, b, 1.0 / (math.log(b) - math.log(a)))
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def lu_logpdf_scalar(x, a, b):
+    """ Logarithm of the pdf of LogUniform(a, b) evaluated at x. """
+    return _lu_logpdf_scalar(x, a, b, math.log(math.log(b) - math.log(a)))
+
+
+@functools.lru_cache(maxsize=None)
+def _lu_pdf_cfunc():
+    # compiled on first use, as double lu_pdf(double x, double a, double b)
+    if not HAS_NUMBA:
+        raise ImportError('numba is required to compile the C function')
+    from numba import cfunc
+
+    @cfunc('float64(float64, float64, float64)', cache=True)
+    def lu_pdf(x, a, b):
+        return lu_pdf_scalar(x, a, b)
+
+    return lu_pdf
@@ -11,6 +11,7 @@ setup(name='LogUniform',
       license='MIT',
       packages=['loguniform'],
       intall_requires=['numpy',],
+      extras_require={'fast': ['numba', 'numexpr'],},
       setup_requires=['pytest-runner',],
       tests_require=['pytest',],
       classifiers=(
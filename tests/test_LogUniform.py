@@ -1,7 +1,14 @@
-from unittest import TestCase
-
-from numpy import isscalar
+import subprocess
+import sys
+from unittest import TestCase, skipIf, skipUnless
+from unittest.mock import patch
+
+from numpy import (isscalar, float32, float64, dtype, linspace, sort,
+                   concatenate, array, allclose, inf, nan, bool_, int8, int16,
+                   int32, int64, uint8, float16)
 from loguniform import LogUniform as dist
+from loguniform import _kernels
+from loguniform.LogUniform import numexpr, _NUMEXPR_MIN_SIZE
 
 
 class test_constructor(TestCase):
@@ -13,14 +20,14 @@ class test_constructor(TestCase):
             dist(b=1000)
     
     def test2(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(a=10, b=1)
 
     def test3(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(a=0, b=1)
         
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(a=0, b=0)
 
     def test4(self):
@@ -60,6 +67,145 @@ class test_methods(TestCase):
         self.assertNotEqual(d.pdf(d.b), 0.0)
         self.assertGreater(d.pdf(d.b), 0.0)
 
+    def test_0d(self):
+        d = dist(a=1, b=10)
+        for f in (d.pdf, d.logpdf, d.cdf, d.sf, d.ppf):
+            self.assertTrue(isscalar(f(array(0.5))))
+            self.assertEqual(f(array([0.5])).shape, (1, ))
+
+    def test_batch(self):
+        a, b = array([1.0, 10.0, 2.5]), array([10.0, 500.0, 3.0])
+        x = array([0.5, 1.0, 2.7, 10.0, 600.0])
+        p = array([-0.1, 0.0, 0.4, 1.0])
+
+        pdf = dist.pdf_batch(a[:, None], b[:, None], x)
+        cdf = dist.cdf_batch(a[:, None], b[:, None], x)
+        ppf = dist.ppf_batch(a[:, None], b[:, None], p)
+        self.assertEqual(pdf.shape, (3, 5))
+        self.assertEqual(ppf.shape, (3, 4))
+
+        for i in range(a.size):
+            d = dist(a[i], b[i])
+            self.assertTrue(allclose(pdf[i], d.pdf(x)))
+            self.assertTrue(allclose(cdf[i], d.cdf(x)))
+            self.assertTrue(allclose(ppf[i], d.ppf(p), equal_nan=True))
+
+        for f in (dist.pdf_batch, dist.cdf_batch, dist.ppf_batch):
+            with self.assertRaises(ValueError):
+                f(10, 1, 0.5)
+            with self.assertRaises(ValueError):
+                f([-1, 1], 10, 0.5)
+
+    def test_scalar_functions(self):
+        from loguniform import lu_pdf_scalar, lu_logpdf_scalar
+
+        d = dist(a=10, b=5000)
+        for x in (0.0, 10.0, 123.4, 5000.0, 6000.0):
+            self.assertAlmostEqual(lu_pdf_scalar(x, 10, 5000), d.pdf(x))
+            self.assertAlmostEqual(lu_logpdf_scalar(x, 10, 5000),
+                                   d.logpdf(x))
+
+    @skipUnless(_kernels.HAS_NUMBA, 'numba is not installed')
+    def test_scalar_functions_numba(self):
+        import ctypes
+        from numba import njit
+        from loguniform import lu_pdf_scalar, lu_logpdf_scalar
+
+        @njit
+        def prior(x):
+            return lu_pdf_scalar(x, 10.0, 5000.0), \
+                lu_logpdf_scalar(x, 10.0, 5000.0)
+
+        d = dist(a=10, b=5000)
+        for x in (0.0, 123.4, 6000.0):
+            pdf, logpdf = prior(x)
+            self.assertAlmostEqual(pdf, d.pdf(x))
+            self.assertAlmostEqual(logpdf, d.logpdf(x))
+
+        f = ctypes.CFUNCTYPE(*[ctypes.c_double] * 4)(d.pdf_scalar_addr())
+        self.assertAlmostEqual(f(123.4, 10, 5000), d.pdf(123.4))
+
+    @skipUnless(_kernels.HAS_NUMBA, 'numba is not installed')
+    def test_code_paths(self):
+        # the numba kernels, the NumPy code and the Python scalar code must
+        # agree, including at the bounds and for 0, nan and inf
+        d = dist(a=10, b=5000)
+        x = [-inf, -1.0, 0.0, 10.0, 123.4, 5000.0, 6000.0, inf, nan]
+        p = [-inf, -0.1, 0.0, 0.3, 1.0, 1.1, inf, nan]
+        for f, v in ((d.pdf, x), (d.logpdf, x), (d.cdf, x), (d.ppf, p)):
+            python = array([f(float(vi)) for vi in v])
+            numba = f(array(v))
+            numba_scalar = array([f(float64(vi)) for vi in v])
+            with patch.object(_kernels, 'HAS_NUMBA', False):
+                numpy = f(array(v))
+                numpy_scalar = array([f(float64(vi)) for vi in v])
+            for r in (numba, numba_scalar, numpy, numpy_scalar):
+                self.assertTrue(allclose(r, python, rtol=1e-14,
+                                         equal_nan=True))
+
+    def test_cdf_sorted(self):
+        d = dist(a=10, b=5000)
+        x = sort(concatenate([[-1.0, 0.0, 10.0, 5000.0], d.rvs(100),
+                              d.rvs(100) * 3]))
+        x = sort(concatenate([x, [nan, inf, -inf]]))
+        self.assertTrue(allclose(d.cdf_sorted(x), d.cdf(x), equal_nan=True))
+        self.assertTrue(isscalar(d.cdf_sorted(array(20.0))))
+        self.assertAlmostEqual(d.cdf_sorted(array(20.0)), d.cdf(20.0))
+
+    @skipIf(numexpr is None, 'numexpr is not installed')
+    def test_ppf_numexpr(self):
+        d = dist(a=1, b=10)
+        p = linspace(-0.1, 1.1, 2 * _NUMEXPR_MIN_SIZE)
+        with patch.object(_kernels, 'HAS_NUMBA', False), \
+                patch.object(numexpr, 'evaluate',
+                             wraps=numexpr.evaluate) as evaluate:
+            for dt in (float64, 'float32', dtype('f4')):
+                v = d.ppf(p, dtype=dt)
+                self.assertEqual(v.dtype, dtype(dt))
+                self.assertTrue(allclose(v, d.ppf(p), equal_nan=True))
+            self.assertTrue(evaluate.called)
+
+    def test_dtype(self):
+        d = dist(a=1, b=10)
+        x = linspace(-1, 11, 50)
+        p = linspace(-0.1, 1.1, 50)
+        for dt in (float32, 'float32', dtype('f4'), float64, 'f8'):
+            for f, v in ((d.pdf, x), (d.cdf, x), (d.ppf, p)):
+                r = f(v, dtype=dt)
+                self.assertEqual(r.dtype, dtype(dt))
+                self.assertTrue(allclose(r, f(v), rtol=1e-5, equal_nan=True))
+            self.assertEqual(d.rvs(25, dtype=dt).dtype, dtype(dt))
+
+        # scalars too, in every code path
+        for v in (5, 5.0, float64(5), float32(5), array(5.0)):
+            for f in (d.pdf, d.cdf, d.ppf):
+                for dt in (float32, 'f4'):
+                    self.assertEqual(f(v, dtype=dt).dtype, dtype(dt))
+                with self.assertRaises(ValueError):
+                    f(v, dtype='float16')
+
+        with self.assertRaises(ValueError):
+            d.pdf(x, dtype='float16')
+
+    def test_numpy_scalars(self):
+        d = dist(a=1, b=10)
+        types = (bool, bool_, int8, int16, int32, int64, uint8,
+                 float16, float32, float64)
+        for t in types:
+            for v in (0, 1):
+                for f in (d.pdf, d.logpdf, d.cdf, d.ppf):
+                    r = f(t(v))
+                    self.assertTrue(isscalar(r))
+                    self.assertAlmostEqual(r, f(float(v)))
+
+    def test_lazy_import(self):
+        # numba is only imported when the kernels are first used
+        code = ('import sys, loguniform; '
+                'assert "numba" not in sys.modules; '
+                'loguniform.LogUniform(1, 10).pdf(2.0); '
+                'assert "numba" not in sys.modules')
+        subprocess.run([sys.executable, '-c', code], check=True)
+
     def test_rvs(self):
         d = dist(a=1, b=10)
         self.assertTrue(isscalar(d.rvs()))
@@ -69,3 +215,8 @@ class test_methods(TestCase):
         self.assertTrue(d.rvs(25).size == 25)
         self.assertTrue((d.rvs(25) >= 1.0).all())
         self.assertTrue((d.rvs(25) <= 10.0).all())
+
+        self.assertTrue((d.rvs(5, random_state=42) ==
+                         d.rvs(5, random_state=42)).all())
+
+        self.assertEqual(d.rvs(25, dtype=float32).dtype, float32)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from numpy import array, allclose, isscalar
+from loguniform import LogUniform
+from loguniform import LogUniformArray as dist
+
+
+class test_constructor(TestCase):
+    def test1(self):
+        with self.assertRaises(TypeError):
+            dist(a=[1, 2])
+
+        with self.assertRaises(TypeError):
+            dist(b=[10, 20])
+
+    def test2(self):
+        with self.assertRaises(ValueError):
+            dist(a=[1, 10], b=[10, 1])
+
+    def test3(self):
+        with self.assertRaises(ValueError):
+            dist(a=[0, 1], b=[1, 10])
+
+    def test4(self):
+        d = dist(a=[1, 10.3], b=[100, 665.1])
+        self.assertTrue((d.a == [1, 10.3]).all())
+        self.assertTrue((d.b == [100, 665.1]).all())
+
+        d = dist(a=1, b=[10, 100, 1000])
+        self.assertEqual(d.a.shape, (3,))
+
+
+class test_methods(TestCase):
+    a = array([1.0, 10.0, 2.5])
+    b = array([10.0, 500.0, 3.0])
+
+    def test_shapes(self):
+        d = dist(self.a, self.b)
+        x = array([0.5, 1.0, 2.7, 10.0, 600.0])
+        self.assertEqual(d.pdf(x).shape, (3, 5))
+        self.assertEqual(d.pdf(2.7).shape, (3, ))
+        self.assertTrue(isscalar(dist(1, 10).pdf(2.7)))
+
+    def test_against_LogUniform(self):
+        d = dist(self.a, self.b)
+        x = array([0.0, 0.5, 1.0, 2.7, 10.0, 600.0])
+        p = array([-0.1, 0.0, 0.4, 1.0])
+        for i in range(self.a.size):
+            di = LogUniform(self.a[i], self.b[i])
+            self.assertTrue(allclose(d.pdf(x)[i], di.pdf(x)))
+            self.assertTrue(allclose(d.logpdf(x)[i], di.logpdf(x)))
+            self.assertTrue(allclose(d.cdf(x)[i], di.cdf(x)))
+            self.assertTrue(allclose(d.ppf(p)[i], di.ppf(p), equal_nan=True))
+            self.assertAlmostEqual(d.mean[i], di.mean)
+
+    def test_rvs(self):
+        d = dist(self.a, self.b)
+        self.assertEqual(d.rvs().shape, (3, ))
+        self.assertEqual(d.rvs(25).shape, (3, 25))
+        s = d.rvs((25, 2))
+        self.assertEqual(s.shape, (3, 25, 2))
+        self.assertTrue((s >= self.a[:, None, None]).all())
+        self.assertTrue((s <= self.b[:, None, None]).all())
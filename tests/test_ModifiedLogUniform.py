@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from numpy import isscalar
+from numpy import (isscalar, float32, float64, dtype, linspace, sort,
+                   concatenate, allclose, array, inf, nan, bool_, int8, int16,
+                   int32, int64, uint8, float16)
 from loguniform import ModifiedLogUniform as dist
 
 
@@ -16,14 +18,14 @@ class test_constructor(TestCase):
             dist(knee=10)
 
     def test2(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(knee=10, b=1)
 
     def test3(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(knee=0, b=1)
         
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValueError):
             dist(knee=0, b=0)
 
     def test4(self):
@@ -51,6 +53,54 @@ class test_methods(TestCase):
         self.assertNotEqual(d.pdf(d.b), 0.0)
         self.assertGreater(d.pdf(d.b), 0.0)
 
+    def test_cdf(self):
+        d = dist(knee=10, b=5000)
+        for x in (-1.0, 0.0, 1e-12, 10.0, 6000.0):
+            self.assertTrue(allclose(d.cdf(array(x)), d.cdf(x),
+                                     rtol=1e-12, atol=0))
+
+    def test_cdf_sorted(self):
+        d = dist(knee=10, b=5000)
+        x = sort(concatenate([[-1.0, 0.0, 10.0, 5000.0], d.rvs(100),
+                              d.rvs(100) * 3]))
+        x = sort(concatenate([x, [nan, inf, -inf]]))
+        self.assertTrue(allclose(d.cdf_sorted(x), d.cdf(x), equal_nan=True))
+        self.assertTrue(isscalar(d.cdf_sorted(array(20.0))))
+        self.assertAlmostEqual(d.cdf_sorted(array(20.0)), d.cdf(20.0))
+
+    def test_dtype(self):
+        d = dist(knee=1, b=10)
+        x = linspace(-1, 11, 50)
+        p = linspace(-0.1, 1.1, 50)
+        for dt in (float32, 'float32', dtype('f4'), float64, 'f8'):
+            for f, v in ((d.pdf, x), (d.cdf, x), (d.ppf, p)):
+                r = f(v, dtype=dt)
+                self.assertEqual(r.dtype, dtype(dt))
+                self.assertTrue(allclose(r, f(v), rtol=1e-5, equal_nan=True))
+            self.assertEqual(d.rvs(25, dtype=dt).dtype, dtype(dt))
+
+        # scalars too, in every code path
+        for v in (5, 5.0, float64(5), float32(5), array(5.0)):
+            for f in (d.pdf, d.cdf, d.ppf):
+                for dt in (float32, 'f4'):
+                    self.assertEqual(f(v, dtype=dt).dtype, dtype(dt))
+                with self.assertRaises(ValueError):
+                    f(v, dtype='float16')
+
+        with self.assertRaises(ValueError):
+            d.pdf(x, dtype='float16')
+
+    def test_numpy_scalars(self):
+        d = dist(knee=1, b=10)
+        types = (bool, bool_, int8, int16, int32, int64, uint8,
+                 float16, float32, float64)
+        for t in types:
+            for v in (0, 1):
+                for f in (d.pdf, d.logpdf, d.cdf, d.ppf):
+                    r = f(t(v))
+                    self.assertTrue(isscalar(r))
+                    self.assertAlmostEqual(r, f(float(v)))
+
     def test_rvs(self):
         d = dist(knee=1, b=10)
         self.assertTrue(isscalar(d.rvs()))
@@ -60,3 +110,28 @@ class test_methods(TestCase):
         self.assertTrue(d.rvs(25).size == 25)
         self.assertTrue((d.rvs(25) >= 0.0).all())
         self.assertTrue((d.rvs(25) <= 10.0).all())
+
+        self.assertTrue((d.rvs(5, random_state=42) ==
+                         d.rvs(5, random_state=42)).all())
+
+        self.assertEqual(d.rvs(25, dtype=float32).dtype, float32)
+
+    def test_moments(self):
+        # reference values from the integrals of x^n pdf(x), evaluated with
+        # 80-digit decimal arithmetic
+        ref = {
+            (3, 100): (25.27960966684156, 699.0829894336841,
+                       1.1403533000512953, 0.23056798194327488),
+            (1, 10): (3.1703239142424633, 7.6303419357522,
+                      0.801464902824069, -0.49486113068467835),
+            # knee << b
+            (1e-6, 1000): (48.254941431366106, 21798.931794883538,
+                           3.9822647892985956, 16.528554365968006),
+        }
+        for (knee, b), (mean, var, skewness, kurtosis) in ref.items():
+            d = dist(knee=knee, b=b)
+            self.assertAlmostEqual(d.mean / mean, 1.0, places=12)
+            self.assertAlmostEqual(d.var / var, 1.0, places=12)
+            self.assertAlmostEqual(d.std**2 / var, 1.0, places=12)
+            self.assertAlmostEqual(d.skewness / skewness, 1.0, places=12)
+            self.assertAlmostEqual(d.kurtosis / kurtosis, 1.0, places=12)